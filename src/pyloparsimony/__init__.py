@@ -1,4 +1,26 @@
 __version__ = "0.1.0.dev0"
+# `parsimony` is imported eagerly, because the function shadows the submodule of the
+# same name; the module itself is cheap, since pylotree is only loaded when a tree is built.
 from pyloparsimony.parsimony import parsimony, up, down
-from pyloparsimony.util import scenario_ascii_art
-from pyloparsimony.examples import EXAMPLES
+
+__all__ = ['parsimony', 'up', 'down', 'scenario_ascii_art', 'EXAMPLES']
+
+# Public names which are only imported on first access (PEP 562).
+_LAZY = {
+    'scenario_ascii_art': 'pyloparsimony.util',
+    'EXAMPLES': 'pyloparsimony.examples',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -25,8 +25,6 @@ node being investigated during each step.
 
 import statistics
 import random
-from tqdm import tqdm as progressbar
-from pylostatistics.correlations import spearmanr, pointbiserialr
 from pyloparsimony.util import pointbiserialr
 
 
@@ -172,6 +170,8 @@ def rooted_site_concordance(
        * "oddsratio" is the odds ratio computed from the attested and the
          expected concordance scores. 
     """
+    from tqdm import tqdm as progressbar
+
     nodes = {
             node.name: {
                 "attested": [], 
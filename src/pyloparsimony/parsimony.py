@@ -4,7 +4,6 @@ Compute parsimony analyses
 import itertools
 import collections
 
-from pylotree import Tree
 from .util import matrix_from_chars
 
 
@@ -12,6 +11,8 @@ def parsimony(tree, pattern, characters=None, matrix=None):
     """
     Calculate the most parsimonious evolutionary scenario for pattern and tree. 
     """
+    from pylotree import Tree
+
     tree = Tree(tree)
     # Take the set of all observed states as default for all possible characters:
     if not characters:
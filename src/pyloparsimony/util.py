@@ -6,8 +6,6 @@ import statistics
 import random
 from functools import partial
 
-from pylotree import Tree
-
 __all__ = ['matrix_from_chars', 'print_scenario', 'pointbiserialr']
 
 
@@ -29,6 +27,8 @@ def matrix_from_chars(chars, weights=None, symmetric=False, default=1):
 
 
 def scenario_ascii_art(scenario, tree):
+    from pylotree import Tree
+
     tree = Tree(tree)
     scenario = dict(scenario)
 
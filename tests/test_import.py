@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY = {'pylotree', 'pylostatistics', 'tqdm'}
+
+
+def import_times(statement):
+    """
+    Run `statement` in a fresh interpreter and return cumulative import times per module.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import pyloparsimony',
+        'from pyloparsimony import parsimony',
+        'import pyloparsimony.util',
+        'import pyloparsimony.examples',
+        'import pyloparsimony.concordance',
+    ]
+)
+def test_import_is_lazy(statement):
+    times = import_times(statement)
+    assert 'pyloparsimony' in times
+    assert not HEAVY & {name.split('.')[0] for name in times}
+
+
+def test_lazy_attributes():
+    import pyloparsimony
+
+    assert 'EXAMPLES' in dir(pyloparsimony)
+    assert pyloparsimony.EXAMPLES['e1']['matrix'] == [[0, 1, 1], [1, 0, 1], [1, 1, 0]]
+    assert callable(pyloparsimony.scenario_ascii_art)
+    assert callable(pyloparsimony.parsimony)
+    with pytest.raises(AttributeError):
+        pyloparsimony.nonexistent